@@ -18,16 +18,39 @@ app = marimo.App(width="full")
 def imports():
     import marimo as mo
     import pandas as pd
+    import numpy as np
     import altair as alt
-    from datetime import datetime, timedelta
+    try:
+        # Keep chart data server-side and only ship transformed rows to the browser
+        import vegafusion  # noqa: F401
+        alt.data_transformers.enable("vegafusion")
+    except ImportError:
+        pass
     import os
-    return mo, pd, alt, datetime, timedelta, os
+    import functools
+    return mo, pd, np, alt, os, functools
 
 
 @app.cell
-def header(mo):
-    """Dashboard header with title and branding"""
-    return mo.Html("""
+def weave_loader(functools):
+    """Import weave on first use of live data, remembering the outcome"""
+    @functools.cache
+    def load_weave():
+        try:
+            import weave
+        except Exception as e:
+            # Broken installs (e.g. pydantic/protobuf mismatches) raise more than ImportError
+            print(f"Error importing weave: {e}")
+            return None
+        return weave
+
+    return load_weave,
+
+
+@app.cell
+def html_consts(mo):
+    """Static header and footer HTML, built once"""
+    header_html = mo.Html("""
     <div style="background: linear-gradient(135deg, #10b981 0%, #3b82f6 100%);
                 padding: 2rem; border-radius: 12px; color: white; margin-bottom: 1rem;">
         <h1 style="margin: 0; font-size: 2.5rem;">QAgent Dashboard</h1>
@@ -36,6 +59,19 @@ def header(mo):
         </p>
     </div>
     """)
+    footer_html = mo.Html("""
+    <div style="text-align: center; padding: 1rem; color: #6b7280; font-size: 0.9rem; margin-top: 2rem;">
+        <p>QAgent - Self-Healing QA Agent | Powered by Browserbase, Redis, Vercel, W&B Weave</p>
+        <p>Built for WeaveHacks 2024</p>
+    </div>
+    """)
+    return header_html, footer_html
+
+
+@app.cell
+def header(header_html):
+    """Dashboard header with title and branding"""
+    return header_html
 
 
 @app.cell
@@ -46,25 +82,110 @@ def data_source(mo):
 
 
 @app.cell
-def fetch_data(pd, use_mock, os):
+def fix_time_trend(np, functools):
+    """Fix time moving average, compiled with numba only for long histories"""
+    def ema_loop(fix_time, alpha):
+        ema = np.empty(fix_time.shape[0])
+        if fix_time.shape[0] == 0:
+            return ema
+        ema[0] = fix_time[0]
+        for i in range(1, fix_time.shape[0]):
+            ema[i] = alpha * fix_time[i] + (1 - alpha) * ema[i - 1]
+        return ema
+
+    @functools.cache
+    def compiled_ema_loop():
+        try:
+            from numba import njit
+        except ImportError:
+            return ema_loop
+        return njit(ema_loop)
+
+    def fix_time_ema(fix_time, alpha=0.3):
+        # Importing and compiling numba costs ~0.5s, far more than the
+        # plain loop over a few hundred runs; only pay it for large inputs.
+        # fetch_data reads limit=50 runs, so this path is only reached if
+        # that limit is raised.
+        if fix_time.shape[0] >= 10_000:
+            return compiled_ema_loop()(fix_time, alpha)
+        return ema_loop(fix_time, alpha)
+
+    return fix_time_ema,
+
+
+@app.cell
+def run_schema():
+    """Column dtypes for run frames, Arrow-backed when pyarrow is installed"""
+    from enum import IntEnum
+
+    try:
+        import pyarrow  # noqa: F401
+        arrow = '[pyarrow]'
+    except ImportError:
+        arrow = ''
+
+    run_dtypes = {
+        'pass_rate': f'float32{arrow}',
+        'fix_time': f'int32{arrow}',
+        'iterations': f'int32{arrow}',
+        'bugs_fixed': f'int32{arrow}',
+        'bugs_found': f'int32{arrow}',
+        'timestamp': f'string{arrow}',
+    }
+
+    class RunCol(IntEnum):
+        """Positions of the numeric run metrics in summary rows"""
+        PASS_RATE = 0
+        FIX_TIME = 1
+        ITERATIONS = 2
+        BUGS_FIXED = 3
+
+    return run_dtypes, RunCol
+
+
+@app.cell
+def mock_data(pd, fix_time_ema, run_dtypes):
+    """Mock datasets for the demo, built once and shared read-only"""
+    mock_runs_df = pd.DataFrame([
+        {'run': 1, 'pass_rate': 0.33, 'fix_time': 180, 'iterations': 3, 'bugs_fixed': 1, 'bugs_found': 3, 'timestamp': '2024-01-15 10:00'},
+        {'run': 2, 'pass_rate': 0.50, 'fix_time': 150, 'iterations': 2, 'bugs_fixed': 1, 'bugs_found': 2, 'timestamp': '2024-01-15 10:30'},
+        {'run': 3, 'pass_rate': 0.67, 'fix_time': 120, 'iterations': 2, 'bugs_fixed': 1, 'bugs_found': 2, 'timestamp': '2024-01-15 11:00'},
+        {'run': 4, 'pass_rate': 0.83, 'fix_time': 90, 'iterations': 1, 'bugs_fixed': 1, 'bugs_found': 1, 'timestamp': '2024-01-15 11:30'},
+        {'run': 5, 'pass_rate': 1.00, 'fix_time': 60, 'iterations': 1, 'bugs_fixed': 1, 'bugs_found': 1, 'timestamp': '2024-01-15 12:00'},
+    ]).astype(run_dtypes)
+    mock_runs_df['fix_time_ema'] = fix_time_ema(mock_runs_df['fix_time'].to_numpy(dtype='float64'))
+
+    bug_data = pd.DataFrame([
+        {'type': 'UI Bug', 'count': 12},
+        {'type': 'Backend Error', 'count': 8},
+        {'type': 'Data Error', 'count': 5},
+        {'type': 'Test Flaky', 'count': 3},
+        {'type': 'Unknown', 'count': 2}
+    ])
+
+    fixes = [
+        {'status': '✓', 'bug': 'Missing onClick handler', 'file': 'app/cart/page.tsx', 'time': '2m ago', 'iterations': 1},
+        {'status': '✓', 'bug': 'Wrong API route /api/payments', 'file': 'app/api/checkout/route.ts', 'time': '5m ago', 'iterations': 2},
+        {'status': '✓', 'bug': 'Null reference on newsletter', 'file': 'app/signup/page.tsx', 'time': '8m ago', 'iterations': 1},
+        {'status': '⟳', 'bug': 'Timeout in checkout flow', 'file': 'app/checkout/page.tsx', 'time': 'now', 'iterations': 3},
+    ]
+    return mock_runs_df, bug_data, fixes
+
+
+@app.cell
+def fetch_data(pd, np, load_weave, use_mock, os, mock_runs_df, fix_time_ema, run_dtypes):
     """
     Fetch run data from W&B Weave or use mock data.
     In production, this connects to the Weave API.
     """
     if use_mock.value:
-        # Mock data for demonstration
-        runs = [
-            {'run': 1, 'pass_rate': 0.33, 'fix_time': 180, 'iterations': 3, 'bugs_fixed': 1, 'bugs_found': 3, 'timestamp': '2024-01-15 10:00'},
-            {'run': 2, 'pass_rate': 0.50, 'fix_time': 150, 'iterations': 2, 'bugs_fixed': 1, 'bugs_found': 2, 'timestamp': '2024-01-15 10:30'},
-            {'run': 3, 'pass_rate': 0.67, 'fix_time': 120, 'iterations': 2, 'bugs_fixed': 1, 'bugs_found': 2, 'timestamp': '2024-01-15 11:00'},
-            {'run': 4, 'pass_rate': 0.83, 'fix_time': 90, 'iterations': 1, 'bugs_fixed': 1, 'bugs_found': 1, 'timestamp': '2024-01-15 11:30'},
-            {'run': 5, 'pass_rate': 1.00, 'fix_time': 60, 'iterations': 1, 'bugs_fixed': 1, 'bugs_found': 1, 'timestamp': '2024-01-15 12:00'},
-        ]
-        df = pd.DataFrame(runs)
+        df = mock_runs_df
     else:
         # Try to fetch from Weave
         try:
-            import weave
+            weave = load_weave()
+            if weave is None:
+                raise RuntimeError("weave is not available")
 
             # Check for API key
             if not os.environ.get('WANDB_API_KEY'):
@@ -73,53 +194,80 @@ def fetch_data(pd, use_mock, os):
             client = weave.init('qagent')
             runs_list = list(client.runs(limit=50))
 
-            data = []
+            # Fill preallocated columns in place; zeros double as the
+            # placeholder row when there are no runs yet
+            n = max(len(runs_list), 1)
+            pass_rates = np.zeros(n, np.float32)
+            fix_times = np.zeros(n, np.int32)
+            iteration_counts = np.zeros(n, np.int32)
+            fixed_counts = np.zeros(n, np.int32)
+            found_counts = np.zeros(n, np.int32)
+            timestamps = [None] * n
             for i, run in enumerate(runs_list):
-                summary = run.summary or {}
-                data.append({
-                    'run': i + 1,
-                    'pass_rate': summary.get('pass_rate', 0),
-                    'fix_time': summary.get('avg_fix_time_seconds', 0),
-                    'iterations': summary.get('iterations_total', 0),
-                    'bugs_fixed': summary.get('bugs_fixed', 0),
-                    'bugs_found': summary.get('bugs_found', 0),
-                    'timestamp': str(run.created_at) if hasattr(run, 'created_at') else '',
-                })
-
-            df = pd.DataFrame(data) if data else pd.DataFrame([{
-                'run': 1, 'pass_rate': 0, 'fix_time': 0, 'iterations': 0,
-                'bugs_fixed': 0, 'bugs_found': 0, 'timestamp': ''
-            }])
+                run_summary = run.summary or {}
+                pass_rates[i] = run_summary.get('pass_rate') or 0
+                fix_times[i] = round(run_summary.get('avg_fix_time_seconds') or 0)
+                iteration_counts[i] = run_summary.get('iterations_total') or 0
+                fixed_counts[i] = run_summary.get('bugs_fixed') or 0
+                found_counts[i] = run_summary.get('bugs_found') or 0
+                timestamps[i] = getattr(run, 'created_at', None)
+
+            df = pd.DataFrame({
+                'run': np.arange(1, n + 1, dtype=np.int32),
+                'pass_rate': pass_rates,
+                'fix_time': fix_times,
+                'iterations': iteration_counts,
+                'bugs_fixed': fixed_counts,
+                'bugs_found': found_counts,
+                # Converted to string as a whole column by the dtype cast
+                'timestamp': pd.to_datetime(timestamps, errors='coerce', utc=True),
+            }).astype(run_dtypes)
+            df['fix_time_ema'] = fix_time_ema(fix_times.astype(np.float64))
         except Exception as e:
             # Fallback to mock data on error
             print(f"Error fetching Weave data: {e}")
-            runs = [
-                {'run': 1, 'pass_rate': 0.33, 'fix_time': 180, 'iterations': 3, 'bugs_fixed': 1, 'bugs_found': 3, 'timestamp': '2024-01-15 10:00'},
-            ]
-            df = pd.DataFrame(runs)
+            df = mock_runs_df.iloc[:1]
 
     return df,
 
 
 @app.cell
-def metrics(mo, df):
-    """Key metrics cards showing current status"""
+def summary(df, RunCol):
+    """First/latest run and totals shared by the metrics and comparison cells"""
     if len(df) == 0:
-        return mo.md("No data available")
+        return {'runs': 0}
 
-    latest = df.iloc[-1]
-    first = df.iloc[0]
+    # Plain ndarray rows indexed by RunCol, no per-row Series
+    values = df[[col.name.lower() for col in RunCol]].to_numpy(dtype='float64')
+    first = values[0]
+    latest = values[-1]
 
-    # Calculate values
-    pass_rate_val = latest['pass_rate'] * 100
-    fix_time_val = latest['fix_time']
-    total_bugs = df['bugs_fixed'].sum()
-
-    # Calculate improvement
-    if first['fix_time'] > 0:
-        improvement = (1 - latest['fix_time'] / first['fix_time']) * 100
+    # Fix time improvement from the first to the latest run
+    if first[RunCol.FIX_TIME] > 0:
+        improvement = (1 - latest[RunCol.FIX_TIME] / first[RunCol.FIX_TIME]) * 100
     else:
-        improvement = 0
+        improvement = 0.0
+
+    return {
+        'runs': len(df),
+        'first': first,
+        'latest': latest,
+        'total_bugs_fixed': int(values[:, RunCol.BUGS_FIXED].sum()),
+        'pass_rate_pct': latest[RunCol.PASS_RATE] * 100,
+        'improvement_pct': improvement,
+    }
+
+
+@app.cell
+def metrics(mo, summary, RunCol):
+    """Key metrics cards showing current status"""
+    if summary['runs'] == 0:
+        return mo.md("No data available")
+
+    pass_rate_val = summary['pass_rate_pct']
+    fix_time_val = summary['latest'][RunCol.FIX_TIME]
+    total_bugs = summary['total_bugs_fixed']
+    improvement = summary['improvement_pct']
 
     # Create stat cards
     pass_rate = mo.stat(
@@ -150,106 +298,126 @@ def metrics(mo, df):
 
 
 @app.cell
-def pass_rate_chart(mo, alt, df):
+def chart_builders(alt, functools, pd):
+    """Altair chart builders, memoized on the rows they plot"""
+
+    def build_pass_rate_chart(data):
+        return alt.Chart(data).mark_line(
+            point=alt.OverlayMarkDef(filled=True, size=100),
+            strokeWidth=3,
+            color='#10b981'
+        ).encode(
+            x=alt.X('run:O', title='Run #'),
+            y=alt.Y('pass_rate:Q',
+                    title='Pass Rate',
+                    scale=alt.Scale(domain=[0, 1]),
+                    axis=alt.Axis(format='%')),
+            tooltip=[
+                alt.Tooltip('run:O', title='Run'),
+                alt.Tooltip('pass_rate:Q', title='Pass Rate', format='.0%')
+            ]
+        ).properties(
+            title='Test Pass Rate Over Time',
+            width=550,
+            height=300
+        )
+
+    def build_fix_time_chart(data):
+        return alt.Chart(data).mark_bar(
+            color='#3b82f6',
+            cornerRadiusTopLeft=4,
+            cornerRadiusTopRight=4
+        ).encode(
+            x=alt.X('run:O', title='Run #'),
+            y=alt.Y('fix_time:Q', title='Fix Time (seconds)'),
+            tooltip=[
+                alt.Tooltip('run:O', title='Run'),
+                alt.Tooltip('fix_time:Q', title='Fix Time', format='.0f')
+            ]
+        ).properties(
+            title='Average Time to Fix',
+            width=550,
+            height=300
+        )
+
+    def build_bug_types_chart(data):
+        return alt.Chart(data).mark_arc(innerRadius=50, outerRadius=100).encode(
+            theta=alt.Theta('count:Q'),
+            color=alt.Color('type:N',
+                           scale=alt.Scale(
+                               domain=['UI Bug', 'Backend Error', 'Data Error', 'Test Flaky', 'Unknown'],
+                               range=['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#6b7280']
+                           ),
+                           legend=alt.Legend(title='Bug Type')),
+            tooltip=['type:N', 'count:Q']
+        ).properties(
+            title='Bug Types Distribution',
+            width=300,
+            height=300
+        )
+
+    def build_iterations_chart(data):
+        return alt.Chart(data).mark_area(
+            color='#8b5cf6',
+            opacity=0.6,
+            line={'color': '#8b5cf6', 'strokeWidth': 2}
+        ).encode(
+            x=alt.X('run:O', title='Run #'),
+            y=alt.Y('iterations:Q', title='Iterations'),
+            tooltip=[
+                alt.Tooltip('run:O', title='Run'),
+                alt.Tooltip('iterations:Q', title='Iterations')
+            ]
+        ).properties(
+            title='Iterations per Run',
+            width=550,
+            height=200
+        )
+
+    @functools.lru_cache(maxsize=8)
+    def _cached_chart(build, columns, rows):
+        return build(pd.DataFrame.from_records(rows, columns=columns))
+
+    def cached_chart(build, data, columns, use_cache=True):
+        """Reuse the chart built for identical rows instead of rebuilding it"""
+        if not use_cache:
+            return build(data)
+        rows = tuple(data[list(columns)].itertuples(index=False, name=None))
+        return _cached_chart(build, columns, rows)
+
+    return cached_chart, build_pass_rate_chart, build_fix_time_chart, build_bug_types_chart, build_iterations_chart
+
+
+@app.cell
+def pass_rate_chart(mo, df, use_mock, cached_chart, build_pass_rate_chart):
     """Line chart showing pass rate over time"""
     if len(df) == 0:
         return mo.md("No data for pass rate chart")
 
-    chart = alt.Chart(df).mark_line(
-        point=alt.OverlayMarkDef(filled=True, size=100),
-        strokeWidth=3,
-        color='#10b981'
-    ).encode(
-        x=alt.X('run:O', title='Run #'),
-        y=alt.Y('pass_rate:Q',
-                title='Pass Rate',
-                scale=alt.Scale(domain=[0, 1]),
-                axis=alt.Axis(format='%')),
-        tooltip=[
-            alt.Tooltip('run:O', title='Run'),
-            alt.Tooltip('pass_rate:Q', title='Pass Rate', format='.0%')
-        ]
-    ).properties(
-        title='Test Pass Rate Over Time',
-        width=550,
-        height=300
-    )
+    chart = cached_chart(build_pass_rate_chart, df, ('run', 'pass_rate'), use_cache=use_mock.value)
 
     return mo.ui.altair_chart(chart)
 
 
 @app.cell
-def fix_time_chart(mo, alt, df):
+def fix_time_chart(mo, df, use_mock, cached_chart, build_fix_time_chart):
     """Bar chart showing fix time per run"""
     if len(df) == 0:
         return mo.md("No data for fix time chart")
 
-    chart = alt.Chart(df).mark_bar(
-        color='#3b82f6',
-        cornerRadiusTopLeft=4,
-        cornerRadiusTopRight=4
-    ).encode(
-        x=alt.X('run:O', title='Run #'),
-        y=alt.Y('fix_time:Q', title='Fix Time (seconds)'),
-        tooltip=[
-            alt.Tooltip('run:O', title='Run'),
-            alt.Tooltip('fix_time:Q', title='Fix Time', format='.0f')
-        ]
-    ).properties(
-        title='Average Time to Fix',
-        width=550,
-        height=300
-    )
+    chart = cached_chart(build_fix_time_chart, df, ('run', 'fix_time'), use_cache=use_mock.value)
 
     return mo.ui.altair_chart(chart)
 
 
 @app.cell
-def bug_types_data(pd):
-    """Bug types data for pie chart"""
-    bug_data = pd.DataFrame([
-        {'type': 'UI Bug', 'count': 12},
-        {'type': 'Backend Error', 'count': 8},
-        {'type': 'Data Error', 'count': 5},
-        {'type': 'Test Flaky', 'count': 3},
-        {'type': 'Unknown', 'count': 2}
-    ])
-    return bug_data,
-
-
-@app.cell
-def bug_types_chart(mo, alt, bug_data):
+def bug_types_chart(mo, bug_data, cached_chart, build_bug_types_chart):
     """Pie/donut chart showing bug types distribution"""
-    chart = alt.Chart(bug_data).mark_arc(innerRadius=50, outerRadius=100).encode(
-        theta=alt.Theta('count:Q'),
-        color=alt.Color('type:N',
-                       scale=alt.Scale(
-                           domain=['UI Bug', 'Backend Error', 'Data Error', 'Test Flaky', 'Unknown'],
-                           range=['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#6b7280']
-                       ),
-                       legend=alt.Legend(title='Bug Type')),
-        tooltip=['type:N', 'count:Q']
-    ).properties(
-        title='Bug Types Distribution',
-        width=300,
-        height=300
-    )
+    chart = cached_chart(build_bug_types_chart, bug_data, ('type', 'count'))
 
     return mo.ui.altair_chart(chart)
 
 
-@app.cell
-def recent_fixes_data(pd):
-    """Recent fixes table data"""
-    fixes = pd.DataFrame([
-        {'status': '✓', 'bug': 'Missing onClick handler', 'file': 'app/cart/page.tsx', 'time': '2m ago', 'iterations': 1},
-        {'status': '✓', 'bug': 'Wrong API route /api/payments', 'file': 'app/api/checkout/route.ts', 'time': '5m ago', 'iterations': 2},
-        {'status': '✓', 'bug': 'Null reference on newsletter', 'file': 'app/signup/page.tsx', 'time': '8m ago', 'iterations': 1},
-        {'status': '⟳', 'bug': 'Timeout in checkout flow', 'file': 'app/checkout/page.tsx', 'time': 'now', 'iterations': 3},
-    ])
-    return fixes,
-
-
 @app.cell
 def recent_fixes_table(mo, fixes):
     """Table showing recent fixes"""
@@ -260,45 +428,30 @@ def recent_fixes_table(mo, fixes):
 
 
 @app.cell
-def iterations_chart(mo, alt, df):
+def iterations_chart(mo, df, use_mock, cached_chart, build_iterations_chart):
     """Area chart showing iterations per run"""
     if len(df) == 0:
         return mo.md("No data for iterations chart")
 
-    chart = alt.Chart(df).mark_area(
-        color='#8b5cf6',
-        opacity=0.6,
-        line={'color': '#8b5cf6', 'strokeWidth': 2}
-    ).encode(
-        x=alt.X('run:O', title='Run #'),
-        y=alt.Y('iterations:Q', title='Iterations'),
-        tooltip=[
-            alt.Tooltip('run:O', title='Run'),
-            alt.Tooltip('iterations:Q', title='Iterations')
-        ]
-    ).properties(
-        title='Iterations per Run',
-        width=550,
-        height=200
-    )
+    chart = cached_chart(build_iterations_chart, df, ('run', 'iterations'), use_cache=use_mock.value)
 
     return mo.ui.altair_chart(chart)
 
 
 @app.cell
-def comparison_table(mo, df, pd):
+def comparison_table(mo, summary, RunCol):
     """Before/After comparison"""
-    if len(df) < 2:
+    if summary['runs'] < 2:
         return mo.md("Need at least 2 runs for comparison")
 
-    first = df.iloc[0]
-    latest = df.iloc[-1]
+    first = summary['first']
+    latest = summary['latest']
 
-    comparison_data = pd.DataFrame([
-        {'Metric': 'Pass Rate', 'Before': f"{first['pass_rate']*100:.0f}%", 'After': f"{latest['pass_rate']*100:.0f}%", 'Change': f"+{(latest['pass_rate'] - first['pass_rate'])*100:.0f}%"},
-        {'Metric': 'Fix Time', 'Before': f"{first['fix_time']:.0f}s", 'After': f"{latest['fix_time']:.0f}s", 'Change': f"{latest['fix_time'] - first['fix_time']:.0f}s"},
-        {'Metric': 'Iterations', 'Before': f"{first['iterations']:.0f}", 'After': f"{latest['iterations']:.0f}", 'Change': f"{latest['iterations'] - first['iterations']:.0f}"},
-    ])
+    comparison_data = [
+        {'Metric': 'Pass Rate', 'Before': f"{first[RunCol.PASS_RATE]*100:.0f}%", 'After': f"{latest[RunCol.PASS_RATE]*100:.0f}%", 'Change': f"+{(latest[RunCol.PASS_RATE] - first[RunCol.PASS_RATE])*100:.0f}%"},
+        {'Metric': 'Fix Time', 'Before': f"{first[RunCol.FIX_TIME]:.0f}s", 'After': f"{latest[RunCol.FIX_TIME]:.0f}s", 'Change': f"{latest[RunCol.FIX_TIME] - first[RunCol.FIX_TIME]:.0f}s"},
+        {'Metric': 'Iterations', 'Before': f"{first[RunCol.ITERATIONS]:.0f}", 'After': f"{latest[RunCol.ITERATIONS]:.0f}", 'Change': f"{latest[RunCol.ITERATIONS] - first[RunCol.ITERATIONS]:.0f}"},
+    ]
 
     return mo.vstack([
         mo.md("### Before vs After"),
@@ -319,14 +472,9 @@ def bottom_row(mo, bug_types_chart, recent_fixes_table):
 
 
 @app.cell
-def footer(mo):
+def footer(footer_html):
     """Dashboard footer with credits"""
-    return mo.Html("""
-    <div style="text-align: center; padding: 1rem; color: #6b7280; font-size: 0.9rem; margin-top: 2rem;">
-        <p>QAgent - Self-Healing QA Agent | Powered by Browserbase, Redis, Vercel, W&B Weave</p>
-        <p>Built for WeaveHacks 2024</p>
-    </div>
-    """)
+    return footer_html
 
 
 @app.cell
@@ -3,6 +3,8 @@ QAgent Voice Agent using Pipecat + Daily
 """
 import asyncio
 import os
+import re
+import time
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
@@ -12,11 +14,36 @@ from pipecat.services.deepgram import DeepgramSTTService
 from pipecat.services.elevenlabs import ElevenLabsTTSService
 from pipecat.transports.services.daily import DailyParams, DailyTransport
 import aiohttp
+import orjson
+from yarl import URL
 
+# Used as the aiohttp base_url, so it must be an origin (scheme://host[:port]);
+# a path prefix such as http://host/qagent is rejected when the agent starts
 ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:3000")
+RUNS_CACHE_TTL_SECONDS = 2.0
+PREFETCH_DELAY_SECONDS = 1.0
+# Prefetched listings outlive command fetches: long enough to cover
+# speaking the reply plus the user's think time
+PREFETCH_TTL_SECONDS = 15.0
 
 
 class QAgentVoiceAgent:
+    # One anchored lookahead per command, tried in priority order, so the
+    # highest-priority command mentioned anywhere in the utterance wins
+    _CMD_RE = re.compile(
+        r"^(?:(?=.*?(?P<run>run test|start test|begin test))"
+        r"|(?=.*?(?P<bugs>what bug|show bug|found bug))"
+        r"|(?=.*?(?P<explain>explain|tell me about))"
+        r"|(?=.*?(?P<status>status)))",
+        re.IGNORECASE | re.DOTALL,
+    )
+    _CMD_HANDLERS = {
+        "run": "run_tests",
+        "bugs": "get_bugs",
+        "explain": "explain_fix",
+        "status": "get_status",
+    }
+
     def __init__(self):
         self.system_prompt = """You are QAgent, a self-healing QA agent.
 You help developers find and fix bugs automatically.
@@ -28,109 +55,178 @@ Available commands:
 - "status" - Shows current agent status
 
 Be concise, friendly, and technical. Always explain what you're doing."""
+        self._session: aiohttp.ClientSession | None = None
+        self._runs_cache: dict | None = None
+        self._runs_cache_ts = 0.0
+        self._runs_cache_ttl = RUNS_CACHE_TTL_SECONDS
+        self._runs_inflight: asyncio.Task | None = None
+        self._runs_generation = 0
+        self._prefetch_task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        if URL(ORCHESTRATOR_URL).path not in ("", "/"):
+            raise ValueError(
+                f"ORCHESTRATOR_URL must be an origin like http://localhost:3000, got {ORCHESTRATOR_URL!r}"
+            )
+
+        # One keep-alive session for the agent's lifetime instead of one per command
+        self._session = aiohttp.ClientSession(
+            base_url=ORCHESTRATOR_URL,
+            connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+        await self._session.close()
+        self._session = None
+
+    async def _get_runs(self, ttl: float = RUNS_CACHE_TTL_SECONDS, refresh: bool = False) -> dict:
+        """GET /api/runs, cached for ttl seconds and shared between overlapping callers"""
+        if not refresh and self._runs_cache is not None and time.monotonic() - self._runs_cache_ts < self._runs_cache_ttl:
+            return self._runs_cache
+
+        if self._runs_inflight is None:
+            self._runs_inflight = asyncio.create_task(self._fetch_runs(ttl))
+        # Shield so one cancelled caller doesn't abort the fetch for the others
+        return await asyncio.shield(self._runs_inflight)
+
+    async def _fetch_runs(self, ttl: float) -> dict:
+        generation = self._runs_generation
+        try:
+            async with self._session.get("/api/runs") as resp:
+                ok = resp.status == 200
+                data = orjson.loads(await resp.read())
+            # Only cache real listings (not e.g. a 401 error body), and never
+            # from a fetch that started before an invalidation
+            if ok and generation == self._runs_generation:
+                self._runs_cache = data
+                self._runs_cache_ts = time.monotonic()
+                self._runs_cache_ttl = ttl
+            return data
+        finally:
+            if self._runs_inflight is asyncio.current_task():
+                self._runs_inflight = None
+
+    def _invalidate_runs(self) -> None:
+        self._runs_generation += 1
+        self._runs_cache = None
+        # Later callers start a fresh fetch instead of joining the outdated one
+        self._runs_inflight = None
+
+    def _schedule_prefetch(self) -> None:
+        # At most one pending prefetch, however many commands arrive
+        if self._prefetch_task is None or self._prefetch_task.done():
+            self._prefetch_task = asyncio.create_task(self._prefetch_runs())
+
+    async def _prefetch_runs(self) -> None:
+        """Warm the /api/runs cache while the user is still thinking"""
+        await asyncio.sleep(PREFETCH_DELAY_SECONDS)
+        try:
+            # Always refetch so the listing kept for the think time is current
+            await self._get_runs(ttl=PREFETCH_TTL_SECONDS, refresh=True)
+        except Exception:
+            pass  # Best effort; the next command fetches on demand
 
     async def handle_command(self, text: str) -> str:
-        text_lower = text.lower()
-
-        if any(x in text_lower for x in ["run test", "start test", "begin test"]):
-            return await self.run_tests()
-        elif any(x in text_lower for x in ["what bug", "show bug", "found bug"]):
-            return await self.get_bugs()
-        elif any(x in text_lower for x in ["explain", "tell me about"]):
-            return await self.explain_fix()
-        elif "status" in text_lower:
-            return await self.get_status()
+        match = self._CMD_RE.match(text)
+        if match is None:
+            reply = "I can run tests, show bugs, explain fixes, or give you a status update. What would you like?"
         else:
-            return "I can run tests, show bugs, explain fixes, or give you a status update. What would you like?"
+            reply = await getattr(self, self._CMD_HANDLERS[match.lastgroup])()
+
+        self._schedule_prefetch()
+        return reply
 
     async def run_tests(self) -> str:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{ORCHESTRATOR_URL}/api/runs",
-                json={
-                    "repoName": "Demo App",
-                    "testSpecs": [],
-                    "maxIterations": 5,
-                },
-            ) as resp:
-                if resp.status == 201:
-                    data = await resp.json()
-                    run_id = data.get("run", {}).get("id", "unknown")[:8]
-                    return f"Starting test run. I'll analyze your application and fix any bugs I find. Run ID is {run_id}."
-                else:
-                    return "I encountered an issue starting the tests. Please check the dashboard."
+        async with self._session.post(
+            "/api/runs",
+            data=orjson.dumps({
+                "repoName": "Demo App",
+                "testSpecs": [],
+                "maxIterations": 5,
+            }),
+            headers={"Content-Type": "application/json"},
+        ) as resp:
+            if resp.status == 201:
+                # A new run changes /api/runs, so don't serve the old listing
+                self._invalidate_runs()
+                data = orjson.loads(await resp.read())
+                run_id = data.get("run", {}).get("id", "unknown")[:8]
+                return f"Starting test run. I'll analyze your application and fix any bugs I find. Run ID is {run_id}."
+            else:
+                return "I encountered an issue starting the tests. Please check the dashboard."
 
     async def get_bugs(self) -> str:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{ORCHESTRATOR_URL}/api/runs") as resp:
-                data = await resp.json()
-                runs = data.get("runs", [])
-                if not runs:
-                    return "No test runs found yet. Would you like me to run some tests?"
-
-                latest = runs[0]
-                bugs = latest.get("patchesApplied", 0)
-                if bugs == 0:
-                    return "Good news! No bugs found in the latest run."
-                else:
-                    return f"I found {bugs} bugs in the latest run and applied fixes for all of them."
+        data = await self._get_runs()
+        runs = data.get("runs", [])
+        if not runs:
+            return "No test runs found yet. Would you like me to run some tests?"
+
+        latest = runs[0]
+        bugs = latest.get("patchesApplied", 0)
+        if bugs == 0:
+            return "Good news! No bugs found in the latest run."
+        else:
+            return f"I found {bugs} bugs in the latest run and applied fixes for all of them."
 
     async def explain_fix(self) -> str:
         return "The last fix I applied was adding a null check to the onClick handler. The button was trying to call a function that didn't exist when the user clicked before the page fully loaded."
 
     async def get_status(self) -> str:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{ORCHESTRATOR_URL}/api/runs") as resp:
-                data = await resp.json()
-                stats = data.get("stats", {})
-                total = stats.get("totalRuns", 0)
-                pass_rate = stats.get("passRate", 0)
-                patches = stats.get("patchesApplied", 0)
-                return f"I've run {total} test sessions with a {pass_rate:.0f}% pass rate. I've applied {patches} fixes total."
+        data = await self._get_runs()
+        stats = data.get("stats", {})
+        total = stats.get("totalRuns", 0)
+        pass_rate = stats.get("passRate", 0)
+        patches = stats.get("patchesApplied", 0)
+        return f"I've run {total} test sessions with a {pass_rate:.0f}% pass rate. I've applied {patches} fixes total."
 
 
 async def main():
-    agent = QAgentVoiceAgent()
-
-    transport = DailyTransport(
-        room_url=os.getenv("DAILY_ROOM_URL"),
-        token=os.getenv("DAILY_TOKEN"),
-        bot_name="QAgent",
-        params=DailyParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            transcription_enabled=True,
-        ),
-    )
-
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
-    tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY"),
-        voice_id="21m00Tcm4TlvDq8ikWAM",
-    )
-    llm = OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        model="gpt-4o",
-    )
-
-    context = OpenAILLMContext(
-        messages=[{"role": "system", "content": agent.system_prompt}]
-    )
-
-    pipeline = Pipeline(
-        [
-            transport.input(),
-            stt,
-            context,
-            llm,
-            tts,
-            transport.output(),
-        ]
-    )
-
-    runner = PipelineRunner()
-    task = PipelineTask(pipeline)
-    await runner.run(task)
+    async with QAgentVoiceAgent() as agent:
+        transport = DailyTransport(
+            room_url=os.getenv("DAILY_ROOM_URL"),
+            token=os.getenv("DAILY_TOKEN"),
+            bot_name="QAgent",
+            params=DailyParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                transcription_enabled=True,
+            ),
+        )
+
+        stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+        # Websocket TTS: synthesizes each sentence as soon as the LLM streams it
+        tts = ElevenLabsTTSService(
+            api_key=os.getenv("ELEVENLABS_API_KEY"),
+            voice_id="21m00Tcm4TlvDq8ikWAM",
+        )
+        llm = OpenAILLMService(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            model="gpt-4o",
+        )
+
+        context = OpenAILLMContext(
+            messages=[{"role": "system", "content": agent.system_prompt}]
+        )
+        context_aggregator = llm.create_context_aggregator(context)
+
+        pipeline = Pipeline(
+            [
+                transport.input(),
+                stt,
+                context_aggregator.user(),
+                llm,
+                tts,
+                transport.output(),
+                context_aggregator.assistant(),
+            ]
+        )
+
+        runner = PipelineRunner()
+        task = PipelineTask(pipeline)
+        await runner.run(task)
 
 
 if __name__ == "__main__":